@@ -2,13 +2,16 @@
 """Structural engineering TUI helper."""
 
 import csv
+import functools
 import math
 import os
+from typing import NamedTuple
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import DataTable, Footer, Header, Input, Label, Select, Static, TabbedContent, TabPane
 
 REBAR = [
@@ -22,10 +25,12 @@ REBAR = [
     ("Y32", 32)
 ]
 
-BAR_DICT: dict[str, int] = {name: d for name, d in REBAR}
+BAR_ROW: dict[str, int] = {name: i for i, (name, _) in enumerate(REBAR)}
 
 DEFAULT_BAR = "Y12"
-DEFAULT_ROW = next(i for i, (n, _) in enumerate(REBAR) if n == DEFAULT_BAR)
+DEFAULT_ROW = BAR_ROW[DEFAULT_BAR]
+
+RECALC_DELAY = 0.05   # s — keystrokes closer together than this share one recalculation
 
 # ── Data loading ───────────────────────────────────────────────────────────
 
@@ -37,42 +42,150 @@ def _fmt(val: str, unit: str = "mm") -> str:
     return f"{val} {unit}" if val and val != "0" else "—"
 
 
-OVM_ANCHORS: dict[str, dict] = {}
-OVM_SPACING: dict[str, dict] = {}
+def _read_csv(filename: str, key: str) -> dict[str, dict]:
+    """Read a data CSV into a dict of rows keyed by column *key*; empty if missing."""
+    rows: dict[str, dict] = {}
+    try:
+        with open(os.path.join(_DATA_DIR, filename), newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                rows[row[key]] = row
+    except FileNotFoundError:
+        pass
+    return rows
 
-try:
-    with open(os.path.join(_DATA_DIR, "ovm_anchors.csv"), newline="", encoding="utf-8-sig") as _f:
-        for _row in csv.DictReader(_f):
-            OVM_ANCHORS[_row["Anchor_Name"]] = _row
-except FileNotFoundError:
-    pass
 
-try:
-    with open(os.path.join(_DATA_DIR, "ovm_anchor_spacing.csv"), newline="", encoding="utf-8-sig") as _f:
-        for _row in csv.DictReader(_f):
-            OVM_SPACING[_row["Anchor_Name"]] = _row
-except FileNotFoundError:
-    pass
+def _read_csv_columns(filename: str, key: str, fields: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Read only *fields* of a data CSV, as tuples keyed by column *key*; empty if missing."""
+    try:
+        with open(os.path.join(_DATA_DIR, filename), newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return {}
+            idx  = {name: i for i, name in enumerate(header)}
+            k    = idx[key]
+            cols = [idx[name] for name in fields]
+            return {row[k]: tuple(row[c] for c in cols) for row in reader if row}
+    except FileNotFoundError:
+        return {}
+
+
+class AnchorRow(NamedTuple):
+    """One OVM anchor's dimensions; field names match the CSV columns."""
+
+    Casting_Dia:  str
+    Casting_Len:  str
+    Duct_ID:      str
+    Head_Dia:     str
+    Head_T:       str
+    Spiral_Dia:   str
+    Bar_size:     str
+    Spiral_pitch: str
+    Spiral_turns: str
+
+
+OVM_SPACING_FIELDS = ("40_a", "40_b", "50_a", "50_b", "60_a", "60_b")
 
-# ── Macalloy stress bar data ────────────────────────────────────────────────
 
-MACALLOY_BARS: dict[str, dict] = {}
+# The CSVs are only read when their tab is first shown, not at import.
 
-try:
-    with open(os.path.join(_DATA_DIR, "macalloy_bars.csv"), newline="", encoding="utf-8-sig") as _f:
-        for _row in csv.DictReader(_f):
-            MACALLOY_BARS[_row["bar_dia"]] = _row
-except FileNotFoundError:
-    pass
+@functools.cache
+def _load_ovm_anchors() -> dict[str, AnchorRow]:
+    """OVM anchor dimensions keyed by anchor name."""
+    rows = _read_csv_columns("ovm_anchors.csv", "Anchor_Name", AnchorRow._fields)
+    return {name: AnchorRow._make(vals) for name, vals in rows.items()}
 
-MACALLOY_BAR_DIAS    = list(MACALLOY_BARS.keys())
-DEFAULT_MACALLOY_DIA = MACALLOY_BAR_DIAS[0] if MACALLOY_BAR_DIAS else "20"
+
+@functools.cache
+def _load_ovm_spacing() -> dict[str, tuple[str, ...]]:
+    """OVM minimum anchor spacings (OVM_SPACING_FIELDS order) keyed by anchor name."""
+    return _read_csv_columns("ovm_anchor_spacing.csv", "Anchor_Name", OVM_SPACING_FIELDS)
+
+
+# ── Macalloy stress bar data ────────────────────────────────────────────────
+
+@functools.cache
+def _load_macalloy_bars() -> dict[str, dict]:
+    """Macalloy bar and accessory data keyed by bar diameter."""
+    return _read_csv("macalloy_bars.csv", "bar_dia")
+
+
+# ── Formatted table rows ────────────────────────────────────────────────────
+# The CSV data never changes once read, so each table's rows are formatted
+# once and the Select handlers just add them.
+
+@functools.cache
+def _ovm_dims_rows() -> dict[str, list[tuple[str, str]]]:
+    """Anchor dimension table rows keyed by anchor name."""
+    return {
+        name: [
+            ("Anchor",         name),
+            ("Casting Ø",      _fmt(a.Casting_Dia)),
+            ("Casting length", _fmt(a.Casting_Len)),
+            ("Duct ID",        _fmt(a.Duct_ID)),
+            ("Head Ø",         _fmt(a.Head_Dia)),
+            ("Head thickness", _fmt(a.Head_T)),
+            ("Spiral Ø",       _fmt(a.Spiral_Dia)),
+            ("Spiral bar",     f"Y{a.Bar_size}"),
+            ("Spiral pitch",   _fmt(a.Spiral_pitch)),
+            ("Spiral turns",   a.Spiral_turns),
+        ]
+        for name, a in _load_ovm_anchors().items()
+    }
+
+
+@functools.cache
+def _ovm_spacing_rows() -> dict[str, list[tuple[str, str, str]]]:
+    """Minimum spacing table rows (one per concrete grade) keyed by anchor name."""
+    return {
+        name: [
+            (f"{fck} MPa", _fmt(a_val), _fmt(b_val))
+            for fck, a_val, b_val in zip(("40", "50", "60"), sp[0::2], sp[1::2])
+        ]
+        for name, sp in _load_ovm_spacing().items()
+    }
+
+
+@functools.cache
+def _macalloy_bar_rows() -> dict[str, list[tuple[str, str]]]:
+    """Bar & nut table rows keyed by bar diameter."""
+    return {
+        dia: [
+            ("Bar Ø",        _fmt(bar["bar_dia"])),
+            ("Weight",       f"{bar['kg_per_m']} kg/m"),
+            ("Ult. load",    f"{bar['f_load']} kN"),
+            ("Nut thick.",   _fmt(bar["nut_t"])),
+            ("Nut A/F",      _fmt(bar["nut_across_flat"])),
+        ]
+        for dia, bar in _load_macalloy_bars().items()
+    }
+
+
+@functools.cache
+def _macalloy_acc_rows() -> dict[str, list[tuple[str, str]]]:
+    """Coupler, end plate & spiral table rows keyed by bar diameter."""
+    return {
+        dia: [
+            ("Coupler Ø",      _fmt(bar["coupler_dia"])),
+            ("Coupler length", _fmt(bar["coupler_len"])),
+            ("End plate L",    _fmt(bar["end_plate_len"])),
+            ("End plate W",    _fmt(bar["end_plate_widt"])),
+            ("End plate t",    _fmt(bar["end_plate_t"])),
+            ("Spiral Ø",       _fmt(bar["spiral_d"])),
+            ("Spiral pitch",   _fmt(bar["spiral_pitch"])),
+            ("Spiral turns",   bar["spiral_turns"]),
+            ("Spiral bar",     bar["spiral_bar"]),
+        ]
+        for dia, bar in _load_macalloy_bars().items()
+    }
 
 # ── OVM post-tensioning constants ────────────────────────────────────────────
 
 DEFAULT_STRANDS = 7
 STRAND_ULT_KN   = 279.0   # characteristic breaking load per 15.7 mm strand
 
+_ANCHOR_NAMES = tuple(f"OVM.M15A-{n}" for n in range(38))   # indexed by strand count
+
 PT_SPACING_FIGURE = (
     " ─── concrete edge ─────────────────\n"
     " │\n"
@@ -85,11 +198,27 @@ PT_SPACING_FIGURE = (
     " b   min. edge distance (ctr to face)"
 )
 
+
+@functools.lru_cache(maxsize=64)
+def _pt_rows(n: int) -> tuple[tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...], str, str]:
+    """Dimension rows, spacing rows and P_ult / P_75% labels for an *n*-strand anchor."""
+    anchor_name = _ANCHOR_NAMES[n]
+    max_force   = n * STRAND_ULT_KN
+    return (
+        tuple(_ovm_dims_rows().get(anchor_name, ())),
+        tuple(_ovm_spacing_rows().get(anchor_name, ())),
+        f"P_ult  {max_force:.0f} kN",
+        f"P_75%  {max_force * 0.75:.0f} kN",
+    )
+
 # ── Rebar helpers ───────────────────────────────────────────────────────────
 
+_PI_OVER_4 = math.pi / 4.0
+
+
 def bar_area(d: float) -> float:
     """Cross-sectional area of a circular bar in mm²."""
-    return math.pi * d ** 2 / 4.0
+    return _PI_OVER_4 * d * d
 
 
 def bar_weight(d: float) -> float:
@@ -97,6 +226,18 @@ def bar_weight(d: float) -> float:
     return bar_area(d) * 7850e-6
 
 
+# (name, Ø, area mm², kg/m, area str, kg/m str) — fixed, so built once at import
+REBAR_ROWS: tuple[tuple[str, int, float, float, str, str], ...] = tuple(
+    (name, d, bar_area(d), bar_weight(d), f"{bar_area(d):.1f}", f"{bar_weight(d):.3f}")
+    for name, d in REBAR
+)
+
+BAR_AREA: dict[str, float] = {name: a for name, _, a, _, _, _ in REBAR_ROWS}
+
+SELECT_BAR_OPTIONS = [(name, name) for name, _ in REBAR]
+STRAND_OPTIONS     = [(str(n), n) for n in range(1, 38)]
+
+
 class StructCalcApp(App):
     """Structural engineering calculator."""
 
@@ -108,211 +249,7 @@ class StructCalcApp(App):
         Binding("r", "reset", "Reset"),
     ]
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    TabbedContent {
-        height: 1fr;
-    }
-
-    TabbedContent ContentSwitcher {
-        height: 1fr;
-    }
-
-    TabPane {
-        height: 1fr;
-        padding: 0;
-    }
-
-    /* ── Rebar tab ── */
-
-    #body {
-        height: 1fr;
-    }
-
-    #ref-panel {
-        width: 38;
-        border: solid $primary;
-        margin: 1 0 1 1;
-        padding: 0 1;
-    }
-
-    #ref-panel DataTable {
-        height: 1fr;
-    }
-
-    #calc-panel {
-        border: solid $primary;
-        margin: 1;
-        padding: 0 2 1 2;
-    }
-
-    .panel-title {
-        background: $primary;
-        color: $text;
-        text-align: center;
-        text-style: bold;
-        padding: 0 1;
-        margin-bottom: 1;
-    }
-
-    .section-label {
-        color: $accent;
-        text-style: bold;
-        margin-top: 1;
-        border-bottom: dashed $accent;
-        padding-bottom: 0;
-    }
-
-    .field-label {
-        margin-top: 1;
-        color: $text-muted;
-    }
-
-    .result-box {
-        margin-top: 1;
-        padding: 0 1;
-        border: solid $success;
-        color: $success;
-        text-style: bold;
-        height: 3;
-        content-align: left middle;
-    }
-
-    .result-box.empty {
-        border: solid $surface-darken-2;
-        color: $text-disabled;
-    }
-
-    Input {
-        margin-top: 0;
-        width: 1fr;
-    }
-
-    Select {
-        margin-top: 0;
-        width: 1fr;
-    }
-
-    /* ── OVM PT Anchors tab ── */
-
-    #pt-body {
-        height: 1fr;
-    }
-
-    #pt-selector-row {
-        height: auto;
-        padding: 1 2 0 2;
-        align: left middle;
-    }
-
-    #pt-selector-row Label {
-        width: auto;
-        padding: 1 1 0 0;
-        margin: 0;
-        color: $text-muted;
-    }
-
-    #pt-selector-row Select {
-        width: 28;
-        margin: 0;
-    }
-
-    .force-box {
-        width: auto;
-        min-width: 22;
-        height: 3;
-        padding: 0 1;
-        margin: 0 0 0 2;
-        border: solid $success;
-        color: $success;
-        text-style: bold;
-        content-align: left middle;
-    }
-
-    #pt-content {
-        height: 1fr;
-    }
-
-    #pt-dims-panel {
-        width: 1fr;
-        border: solid $primary;
-        margin: 1 0 1 1;
-        padding: 0 1;
-    }
-
-    #pt-dims-panel DataTable {
-        height: 1fr;
-    }
-
-    #pt-spacing-panel {
-        width: 54;
-        border: solid $primary;
-        margin: 1 1 1 1;
-        padding: 0 1;
-    }
-
-    #pt-spacing-panel DataTable {
-        height: auto;
-    }
-
-    #pt-spacing-figure {
-        padding: 1 1 0 1;
-        color: $text-muted;
-    }
-
-    /* ── Macalloy Bars tab ── */
-
-    #mac-body {
-        height: 1fr;
-    }
-
-    #mac-selector-row {
-        height: auto;
-        padding: 1 2 0 2;
-        align: left middle;
-    }
-
-    #mac-selector-row Label {
-        width: auto;
-        padding: 1 1 0 0;
-        margin: 0;
-        color: $text-muted;
-    }
-
-    #mac-selector-row Select {
-        width: 28;
-        margin: 0;
-    }
-
-    #mac-content {
-        height: 1fr;
-    }
-
-    #mac-bar-panel {
-        width: 1fr;
-        border: solid $primary;
-        margin: 1 0 1 1;
-        padding: 0 1;
-    }
-
-    #mac-bar-panel DataTable {
-        height: 1fr;
-    }
-
-    #mac-acc-panel {
-        width: 1fr;
-        border: solid $primary;
-        margin: 1 1 1 1;
-        padding: 0 1;
-    }
-
-    #mac-acc-panel DataTable {
-        height: 1fr;
-    }
-    """
+    CSS_PATH = "rebar_calc.tcss"
 
     selected_bar: reactive[str] = reactive(DEFAULT_BAR)
 
@@ -328,11 +265,8 @@ class StructCalcApp(App):
                         yield Static("REFERENCE", classes="panel-title")
                         table = DataTable(cursor_type="row", id="ref-table")
                         table.add_columns("Bar", "Ø (mm)", "Area mm²", "kg/m")
-                        for name, d in REBAR:
-                            table.add_row(
-                                name, str(d), f"{bar_area(d):.1f}", f"{bar_weight(d):.3f}",
-                                key=name,
-                            )
+                        for name, d, _, _, area_str, weight_str in REBAR_ROWS:
+                            table.add_row(name, str(d), area_str, weight_str, key=name)
                         yield table
 
                     with Vertical(id="calc-panel"):
@@ -340,19 +274,19 @@ class StructCalcApp(App):
 
                         yield Label("Bar size", classes="field-label")
                         yield Select(
-                            [(name, name) for name, _ in REBAR],
+                            SELECT_BAR_OPTIONS,
                             value=DEFAULT_BAR,
                             id="bar-select",
                         )
 
                         yield Label("COUNT", classes="section-label")
                         yield Label("Number of bars", classes="field-label")
-                        yield Input(placeholder="e.g. 5", id="count-input", restrict=r"\d*")
+                        yield Input(placeholder="e.g. 5", id="count-input", restrict=r"\d*", max_length=6)
                         yield Static("—", id="count-result", classes="result-box empty")
 
                         yield Label("SPACING", classes="section-label")
                         yield Label("Centre-to-centre spacing (mm)", classes="field-label")
-                        yield Input(placeholder="e.g. 150", id="spacing-input", restrict=r"[\d.]*")
+                        yield Input(placeholder="e.g. 150", id="spacing-input", restrict=r"[\d.]*", max_length=10)
                         yield Static("—", id="spacing-result", classes="result-box empty")
 
             # ── Tab 2: PT Anchors ──────────────────────────────
@@ -362,7 +296,7 @@ class StructCalcApp(App):
                     with Horizontal(id="pt-selector-row"):
                         yield Label("Number of strands")
                         yield Select(
-                            [(str(n), n) for n in range(1, 38)],
+                            STRAND_OPTIONS,
                             value=DEFAULT_STRANDS,
                             id="strand-select",
                         )
@@ -382,7 +316,7 @@ class StructCalcApp(App):
                             spacing_table = DataTable(cursor_type="none", id="pt-spacing-table")
                             spacing_table.add_columns("f'c (MPa)", "Min c/c  a (mm)", "Min edge  b (mm)")
                             yield spacing_table
-                            yield Static(PT_SPACING_FIGURE, id="pt-spacing-figure")
+                            yield Static(PT_SPACING_FIGURE, id="pt-spacing-figure", markup=False)
 
             # ── Tab 3: Macalloy Bars ───────────────────────────
             with TabPane("Macalloy Bars", id="tab-mac"):
@@ -390,11 +324,8 @@ class StructCalcApp(App):
 
                     with Horizontal(id="mac-selector-row"):
                         yield Label("Bar diameter")
-                        yield Select(
-                            [(f"Ø{d} mm", d) for d in MACALLOY_BAR_DIAS],
-                            value=DEFAULT_MACALLOY_DIA,
-                            id="macalloy-bar-select",
-                        )
+                        # Options are filled when the tab is first shown.
+                        yield Select([], id="macalloy-bar-select")
                         yield Static("", id="mac-ult-force", classes="force-box")
                         yield Static("", id="mac-75-force",  classes="force-box")
 
@@ -415,142 +346,164 @@ class StructCalcApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        self.query_one("#ref-table", DataTable).move_cursor(row=DEFAULT_ROW)
-        self._update_pt_display(DEFAULT_STRANDS)
-        self._update_macalloy_display(DEFAULT_MACALLOY_DIA)
+        # Widgets are looked up once here; the handlers below run per keystroke.
+        self._count_input    = self.query_one("#count-input",    Input)
+        self._count_result   = self.query_one("#count-result",   Static)
+        self._spacing_input  = self.query_one("#spacing-input",  Input)
+        self._spacing_result = self.query_one("#spacing-result", Static)
+        self._ref_table      = self.query_one("#ref-table",      DataTable)
+        self._bar_select     = self.query_one("#bar-select",     Select)
+        self._strand_select  = self.query_one("#strand-select",    Select)
+        self._pt_dims        = self.query_one("#pt-dims-table",    DataTable)
+        self._pt_spacing     = self.query_one("#pt-spacing-table", DataTable)
+        self._pt_max         = self.query_one("#pt-max-force",     Static)
+        self._pt_75          = self.query_one("#pt-75-force",      Static)
+        self._mac_select     = self.query_one("#macalloy-bar-select", Select)
+        self._mac_bar        = self.query_one("#mac-bar-table",  DataTable)
+        self._mac_acc        = self.query_one("#mac-acc-table",  DataTable)
+        self._mac_ult        = self.query_one("#mac-ult-force",  Static)
+        self._mac_75         = self.query_one("#mac-75-force",   Static)
+
+        self._filled_tabs: set[str] = set()
+        self._pending_timer: Timer | None = None
+        self._last_pt_n: int | None = None
+        # Result boxes start with the "empty" class (see compose).
+        self._count_empty   = True
+        self._spacing_empty = True
+        self._last_count_text:   str | None = None
+        self._last_spacing_text: str | None = None
+
+        self._ref_table.move_cursor(row=DEFAULT_ROW)
 
     # ── Event handlers ─────────────────────────────────────────
 
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Fill the PT and Macalloy tabs (reading their CSVs) when first shown."""
+        pane_id = event.pane.id
+        if pane_id in self._filled_tabs:
+            return
+        self._filled_tabs.add(pane_id)
+        if pane_id == "tab-pt":
+            self._update_pt_display(self._strand_select.value)
+        elif pane_id == "tab-mac":
+            dias = list(_load_macalloy_bars())
+            if dias:
+                self._mac_select.set_options([(f"Ø{d} mm", d) for d in dias])
+                self._mac_select.value = dias[0]
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Clicking a row in the reference table updates the calculator."""
         bar_name = str(event.row_key.value)
-        self.query_one("#bar-select", Select).value = bar_name
+        self._bar_select.value = bar_name
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id == "bar-select":
             if event.value is Select.BLANK:
                 return
             self.selected_bar = str(event.value)
-            names = [n for n, _ in REBAR]
-            if self.selected_bar in names:
-                self.query_one("#ref-table", DataTable).move_cursor(
-                    row=names.index(self.selected_bar)
-                )
+            row = BAR_ROW.get(self.selected_bar)
+            if row is not None:
+                self._ref_table.move_cursor(row=row)
             self._recalculate()
         elif event.select.id == "strand-select":
-            if isinstance(event.value, int):
+            if isinstance(event.value, int) and "tab-pt" in self._filled_tabs:
                 self._update_pt_display(event.value)
         elif event.select.id == "macalloy-bar-select":
             if isinstance(event.value, str):
                 self._update_macalloy_display(event.value)
 
     def on_input_changed(self, _: Input.Changed) -> None:
-        self._recalculate()
+        """Recalculate once typing pauses rather than on every keystroke."""
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+        self._pending_timer = self.set_timer(RECALC_DELAY, self._recalculate)
 
     # ── Rebar calculation ──────────────────────────────────────
 
     def _recalculate(self) -> None:
-        d = BAR_DICT.get(self.selected_bar, 12)
-        a = bar_area(d)
-
-        count_input  = self.query_one("#count-input",   Input)
-        count_result = self.query_one("#count-result",  Static)
-        try:
-            n = int(count_input.value)
-            if n <= 0:
-                raise ValueError
-            count_result.update(f"{n} × {self.selected_bar}  =  {a * n:.1f} mm²")
-            count_result.remove_class("empty")
-        except ValueError:
-            count_result.update("—")
-            count_result.add_class("empty")
-
-        spacing_input  = self.query_one("#spacing-input",  Input)
-        spacing_result = self.query_one("#spacing-result", Static)
-        try:
-            s = float(spacing_input.value)
-            if s <= 0:
-                raise ValueError
+        a = BAR_AREA.get(self.selected_bar, BAR_AREA[DEFAULT_BAR])
+
+        count_input  = self._count_input
+        count_result = self._count_result
+        # The inputs' `restrict` and `max_length` guarantee these parse once the
+        # empty / lone-"." / repeated-"." cases are ruled out. A value set in
+        # code bypasses `max_length`, so int() still guards the digit limit.
+        val = count_input.value
+        n = 0
+        if val:
+            try:
+                n = int(val)
+            except ValueError:   # more digits than sys.get_int_max_str_digits()
+                pass
+        if n > 0:
+            text = f"{n} × {self.selected_bar}  =  {a * n:.1f} mm²"
+        else:
+            text = "—"
+        if text != self._last_count_text:
+            count_result.update(text)
+            self._last_count_text = text
+        # Only touch the class on a change — each toggle restyles the widget.
+        if (n <= 0) != self._count_empty:
+            self._count_empty = n <= 0
+            count_result.set_class(self._count_empty, "empty")
+
+        spacing_input  = self._spacing_input
+        spacing_result = self._spacing_result
+        val = spacing_input.value
+        s = float(val) if val.strip(".") and val.count(".") <= 1 else 0.0
+        if s > 0:
             area_per_m = a * (1000.0 / s)
-            spacing_result.update(
-                f"{self.selected_bar} @ {s:.0f} mm c/c  =  {area_per_m:.1f} mm²/m"
-            )
-            spacing_result.remove_class("empty")
-        except ValueError:
-            spacing_result.update("—")
-            spacing_result.add_class("empty")
+            text = f"{self.selected_bar} @ {s:.0f} mm c/c  =  {area_per_m:.1f} mm²/m"
+        else:
+            text = "—"
+        if text != self._last_spacing_text:
+            spacing_result.update(text)
+            self._last_spacing_text = text
+        if (s <= 0) != self._spacing_empty:
+            self._spacing_empty = s <= 0
+            spacing_result.set_class(self._spacing_empty, "empty")
 
     # ── PT display ─────────────────────────────────────────────
 
     def _update_pt_display(self, n: int) -> None:
-        anchor_name   = f"OVM.M15A-{n}"
-        dims_table    = self.query_one("#pt-dims-table",    DataTable)
-        spacing_table = self.query_one("#pt-spacing-table", DataTable)
-
-        dims_table.clear()
-        spacing_table.clear()
-
-        max_force = n * STRAND_ULT_KN
-        self.query_one("#pt-max-force", Static).update(f"P_ult  {max_force:.0f} kN")
-        self.query_one("#pt-75-force",  Static).update(f"P_75%  {max_force * 0.75:.0f} kN")
-
-        anchor = OVM_ANCHORS.get(anchor_name)
-        if anchor:
-            dims_table.add_row("Anchor",         anchor_name)
-            dims_table.add_row("Casting Ø",      _fmt(anchor["Casting_Dia"]))
-            dims_table.add_row("Casting length", _fmt(anchor["Casting_Len"]))
-            dims_table.add_row("Duct ID",        _fmt(anchor["Duct_ID"]))
-            dims_table.add_row("Head Ø",         _fmt(anchor["Head_Dia"]))
-            dims_table.add_row("Head thickness", _fmt(anchor["Head_T"]))
-            dims_table.add_row("Spiral Ø",       _fmt(anchor["Spiral_Dia"]))
-            dims_table.add_row("Spiral bar",     f"Y{anchor['Bar_size']}")
-            dims_table.add_row("Spiral pitch",   _fmt(anchor["Spiral_pitch"]))
-            dims_table.add_row("Spiral turns",   anchor["Spiral_turns"])
-
-        spacing = OVM_SPACING.get(anchor_name)
-        if spacing:
-            for fck in ("40", "50", "60"):
-                a_val = spacing[f"{fck}_a"]
-                b_val = spacing[f"{fck}_b"]
-                spacing_table.add_row(f"{fck} MPa", _fmt(a_val), _fmt(b_val))
+        if n == self._last_pt_n:
+            return
+        self._last_pt_n = n
+        dims_rows, spacing_rows, ult_text, p75_text = _pt_rows(n)
+
+        self._pt_dims.clear()
+        self._pt_spacing.clear()
+
+        self._pt_max.update(ult_text)
+        self._pt_75.update(p75_text)
+
+        self._pt_dims.add_rows(dims_rows)
+        self._pt_spacing.add_rows(spacing_rows)
 
     # ── Macalloy display ───────────────────────────────────────
 
     def _update_macalloy_display(self, dia: str) -> None:
-        bar_table = self.query_one("#mac-bar-table", DataTable)
-        acc_table = self.query_one("#mac-acc-table", DataTable)
+        bar_table = self._mac_bar
+        acc_table = self._mac_acc
         bar_table.clear()
         acc_table.clear()
 
-        bar = MACALLOY_BARS.get(dia)
+        bar = _load_macalloy_bars().get(dia)
         if not bar:
             return
 
         f_load = float(bar["f_load"])
-        self.query_one("#mac-ult-force", Static).update(f"P_ult  {f_load:.0f} kN")
-        self.query_one("#mac-75-force",  Static).update(f"P_75%  {f_load * 0.75:.0f} kN")
-
-        bar_table.add_row("Bar Ø",        _fmt(bar["bar_dia"]))
-        bar_table.add_row("Weight",       f"{bar['kg_per_m']} kg/m")
-        bar_table.add_row("Ult. load",    f"{bar['f_load']} kN")
-        bar_table.add_row("Nut thick.",   _fmt(bar["nut_t"]))
-        bar_table.add_row("Nut A/F",      _fmt(bar["nut_across_flat"]))
-
-        acc_table.add_row("Coupler Ø",      _fmt(bar["coupler_dia"]))
-        acc_table.add_row("Coupler length", _fmt(bar["coupler_len"]))
-        acc_table.add_row("End plate L",    _fmt(bar["end_plate_len"]))
-        acc_table.add_row("End plate W",    _fmt(bar["end_plate_widt"]))
-        acc_table.add_row("End plate t",    _fmt(bar["end_plate_t"]))
-        acc_table.add_row("Spiral Ø",       _fmt(bar["spiral_d"]))
-        acc_table.add_row("Spiral pitch",   _fmt(bar["spiral_pitch"]))
-        acc_table.add_row("Spiral turns",   bar["spiral_turns"])
-        acc_table.add_row("Spiral bar",     bar["spiral_bar"])
+        self._mac_ult.update(f"P_ult  {f_load:.0f} kN")
+        self._mac_75.update(f"P_75%  {f_load * 0.75:.0f} kN")
+
+        bar_table.add_rows(_macalloy_bar_rows()[dia])
+        acc_table.add_rows(_macalloy_acc_rows()[dia])
 
     # ── Actions ────────────────────────────────────────────────
 
     def action_reset(self) -> None:
-        self.query_one("#count-input",   Input).value = ""
-        self.query_one("#spacing-input", Input).value = ""
+        self._count_input.value   = ""
+        self._spacing_input.value = ""
 
 
 if __name__ == "__main__":